@@ -1,12 +1,104 @@
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+import xlsxwriter
 from datetime import datetime, timedelta
 import os
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; a NumPy version of the scan is used instead
+    njit = None
+
+
+def _grouped_sum_count(slots, values, length):
+    """Per-slot sum and count of the non-NaN entries of `values`"""
+    present = ~np.isnan(values)
+    sums = np.bincount(slots, weights=np.where(present, values, 0.0), minlength=length)
+    counts = np.bincount(slots, weights=present, minlength=length)
+    return sums, counts
+
+
+def _predict_scan(sat, tenure, rev, churn, rev_thresh):
+    """
+    Walk the customers once, accumulating every predictive_analytics count and sum
+    
+    Returns:
+        tuple: (at_risk_count, at_risk_revenue, new_count, new_churned,
+                high_value_at_risk_count, high_value_at_risk_revenue)
+    """
+    at_risk_cnt = 0
+    at_risk_rev = 0.0
+    new_cnt = 0
+    new_churned = 0.0
+    hv_cnt = 0
+    hv_rev = 0.0
+    for i in range(sat.shape[0]):
+        # Missing revenue counts the customer but adds nothing, like pandas' sum
+        revenue = 0.0 if np.isnan(rev[i]) else rev[i]
+        if sat[i] <= 2:
+            at_risk_cnt += 1
+            at_risk_rev += revenue
+            if rev[i] >= rev_thresh:
+                hv_cnt += 1
+                hv_rev += revenue
+        if tenure[i] < 6:
+            new_cnt += 1
+            new_churned += churn[i]
+    return at_risk_cnt, at_risk_rev, new_cnt, new_churned, hv_cnt, hv_rev
+
+
+def _predict_scan_numpy(sat, tenure, rev, churn, rev_thresh):
+    """Vectorized equivalent of _predict_scan for when numba is not installed"""
+    at_risk = sat <= 2
+    new = tenure < 6
+    high_value = at_risk & (rev >= rev_thresh)
+    rev = np.nan_to_num(rev)
+    return (int(at_risk.sum()), rev[at_risk].sum(), int(new.sum()), churn[new].sum(),
+            int(high_value.sum()), rev[high_value].sum())
+
+
+def _quantile_select(values, q):
+    """
+    Linear-interpolated quantile of the non-NaN values, matching Series.quantile,
+    using O(n) np.partition selection instead of a full sort
+    """
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return np.nan
+    position = (len(values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    selected = np.partition(values, [lower, upper])
+    return selected[lower] + (selected[upper] - selected[lower]) * (position - lower)
+
+
+_predict_kernel = njit(cache=True)(_predict_scan) if njit is not None else _predict_scan_numpy
+
+
 class MTNChurnAnalysis:
+    # Columns read from the CSV; anything else in the file is skipped at parse time
+    _NUMERIC_COLS = ['Age', 'Satisfaction_Rate', 'Customer_Tenure_in_months',
+                     'Unit_Price', 'Number_of_Times_Purchased', 'Total_Revenue', 'Data_Usage']
+    _CATEGORICAL_COLS = ['State', 'MTN_Device', 'Subscription_Plan',
+                         'Customer_Churn_Status', 'Reasons_for_Churn']
+    # Narrowest dtype for each numeric column; nullable integers keep NaNs from coercion.
+    # Total_Revenue stays float64 so Naira totals above 2**24 are summed exactly.
+    _DTYPE_MAP = {'Age': 'Int16', 'Satisfaction_Rate': 'Int8', 'Customer_Tenure_in_months': 'Int16',
+                  'Number_of_Times_Purchased': 'Int16', 'Unit_Price': 'float32',
+                  'Total_Revenue': 'float64', 'Data_Usage': 'float32'}
+    # Derived views of other results; the exporters already write their source tables
+    _EXPORT_SKIP = {'churn_reasons_top10'}
+    # Parquet cache of the prepared frame; bump the version whenever _prepare_data changes
+    _CACHE_SUFFIX = '.mtn_prepared.parquet'
+    _CACHE_VERSION = b'2'
+    _CACHE_VERSION_KEY = b'mtn_churn_cache_version'
+    
     def __init__(self, data_path=None):
         """
         Initialize MTN Churn Analysis Model
@@ -17,6 +109,8 @@ class MTNChurnAnalysis:
         self.data_path = data_path
         self.df = None
         self.analysis_results = {}
+        self._staged = {}
+        self._churn_mask = None
         self.export_folder = "analysis_exports"
         self._create_export_folder()
     
@@ -29,19 +123,58 @@ class MTNChurnAnalysis:
         Load customer data from CSV file
         
         Args:
-            data_path (str): Path to CSV file
+            data_path (str or file-like): Path to CSV file, or a binary buffer such as BytesIO
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
+            if hasattr(data_path, 'read'):
+                # In-memory uploads have no file to keep a Parquet cache beside
+                return self.load_dataframe(self.read_csv(data_path))
+            
             if data_path:
                 self.data_path = data_path
             
             if not self.data_path:
                 raise ValueError("No data path provided")
             
-            self.df = pd.read_csv(self.data_path)
+            csv_path = Path(self.data_path)
+            cache_path = csv_path.with_name(csv_path.stem + self._CACHE_SUFFIX)
+            cached = None
+            if cache_path.exists() and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+                cached = self._read_parquet_cache(cache_path)
+            
+            if cached is not None:
+                # Parquet round-trips the prepared dtypes, so only the churn mask needs rebuilding
+                self.df = cached
+                self._cache_churn_mask()
+            else:
+                self.df = self.read_csv(self.data_path)
+                
+                # Clean and prepare data
+                self._prepare_data()
+                self._write_parquet_cache(cache_path)
+            
+            print(f"✅ Data loaded successfully: {len(self.df)} records")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Error loading data: {str(e)}")
+            return False
+    
+    def load_dataframe(self, df):
+        """
+        Load customer data that has already been parsed, e.g. with read_csv
+        
+        Args:
+            df (pd.DataFrame): Raw customer data
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.df = df
             
             # Clean and prepare data
             self._prepare_data()
@@ -53,25 +186,190 @@ class MTNChurnAnalysis:
             print(f"❌ Error loading data: {str(e)}")
             return False
     
+    @classmethod
+    def read_csv(cls, source):
+        """
+        Parse customer CSV data with pyarrow, projecting only the columns the analysis uses
+        
+        Args:
+            source (str or file-like): Path or binary buffer holding the CSV
+            
+        Returns:
+            pd.DataFrame: Raw customer data, ready for load_dataframe
+        """
+        # Peek at the header so files missing an optional column still load
+        header = pd.read_csv(source, nrows=0).columns
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        wanted = cls._NUMERIC_COLS + cls._CATEGORICAL_COLS + ['Customer_ID', 'Date_of_Purchase']
+        usecols = [col for col in wanted if col in header]
+        
+        # String columns are dictionary-encoded during the parse. Numeric columns are left
+        # wide: pyarrow wraps values that overflow a narrow integer type, so _prepare_data
+        # range-checks and narrows them instead
+        categorical = {col: 'category' for col in cls._CATEGORICAL_COLS if col in usecols}
+        return pd.read_csv(
+            source,
+            engine='pyarrow',
+            usecols=usecols,
+            dtype=categorical,
+            parse_dates=['Date_of_Purchase'] if 'Date_of_Purchase' in usecols else None
+        )
+    
+    def _write_parquet_cache(self, cache_path):
+        """Save the prepared frame next to the CSV, stamped with _CACHE_VERSION, so later loads skip parsing"""
+        try:
+            table = pa.Table.from_pandas(self.df)
+            metadata = {**(table.schema.metadata or {}), self._CACHE_VERSION_KEY: self._CACHE_VERSION}
+            pq.write_table(table.replace_schema_metadata(metadata), cache_path, compression='zstd')
+        except Exception as e:
+            # A missing cache only costs a re-parse next time
+            print(f"⚠️ Could not write Parquet cache: {str(e)}")
+    
+    def _read_parquet_cache(self, cache_path):
+        """
+        Read a prepared-frame cache, rejecting it unless it carries the current version stamp
+        and the columns _prepare_data produces
+        
+        Returns:
+            pd.DataFrame or None: The prepared frame, or None if the cache cannot be used
+        """
+        try:
+            table = pq.read_table(cache_path)
+            if (table.schema.metadata or {}).get(self._CACHE_VERSION_KEY) != self._CACHE_VERSION:
+                return None
+            df = table.to_pandas()
+        except Exception:
+            return None
+        
+        if 'Customer_Churn_Status' in df.columns and (
+                'Churn_Binary' not in df.columns or df['Churn_Binary'].dtype != np.int8):
+            return None
+        for col, dtype in self._DTYPE_MAP.items():
+            if col in df.columns and df[col].dtype not in (dtype, 'float32'):
+                return None
+        for col in self._CATEGORICAL_COLS:
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                return None
+        return df
+    
     def _prepare_data(self):
         """Clean and prepare data for analysis"""
-        # Convert date columns
-        if 'Date_of_Purchase' in self.df.columns:
-            self.df['Date_of_Purchase'] = pd.to_datetime(self.df['Date_of_Purchase'], errors='coerce')
+        # Date_of_Purchase is parsed at read time in load_data
         
-        # Clean numeric columns
-        numeric_columns = ['Age', 'Satisfaction_Rate', 'Customer_Tenure_in_months', 
-                          'Unit_Price', 'Number_of_Times_Purchased', 'Total_Revenue', 'Data_Usage']
+        # Downcast numeric columns in one astype; only columns not already narrowed
+        # (e.g. by an earlier _prepare_data) need coercing first
+        present = {col: dtype for col, dtype in self._DTYPE_MAP.items() if col in self.df.columns}
+        mistyped = [col for col, dtype in present.items() if self.df[col].dtype != dtype]
+        if mistyped:
+            self.df[mistyped] = self.df[mistyped].apply(pd.to_numeric, errors='coerce')
+            for col in mistyped:
+                if not self._fits_integer(self.df[col], present[col]):
+                    # Fractional or out-of-range values stay as floats rather than failing the cast
+                    present[col] = 'float32'
+        self.df = self.df.astype(present)
         
-        for col in numeric_columns:
+        # Low-cardinality string columns are grouped repeatedly; store them as categories
+        # (a no-op for frames parsed by read_csv)
+        for col in self._CATEGORICAL_COLS:
             if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+                self.df[col] = self.df[col].astype('category')
         
         # Create churn binary column
         if 'Customer_Churn_Status' in self.df.columns:
-            self.df['Churn_Binary'] = self.df['Customer_Churn_Status'].map({
-                'Churned': 1, 'Active': 0, 'Yes': 1, 'No': 0, True: 1, False: 0
-            }).fillna(0)
+            status = self.df['Customer_Churn_Status'].astype('category')
+            # One slot per category plus a trailing 0 that missing values (code -1) land on
+            code_map = np.zeros(len(status.cat.categories) + 1, dtype=np.int8)
+            for i, category in enumerate(status.cat.categories):
+                code_map[i] = 1 if category in ('Churned', 'Yes', True) else 0
+            self.df['Churn_Binary'] = code_map[status.cat.codes.to_numpy()]
+        
+        self._cache_churn_mask()
+    
+    @staticmethod
+    def _fits_integer(values, dtype):
+        """True if every non-missing value is whole and within the range of a nullable Int dtype"""
+        if not dtype.startswith('Int'):
+            return True
+        values = values.dropna().to_numpy(dtype='float64')
+        bounds = np.iinfo(dtype.lower())
+        return bool(np.all(values == np.round(values))
+                    and (len(values) == 0 or (values.min() >= bounds.min and values.max() <= bounds.max)))
+    
+    def _cache_churn_mask(self):
+        """Reset staged arrays and cache the churn mask shared by the analyses"""
+        self._staged = {}
+        if 'Churn_Binary' in self.df.columns:
+            churn = self.df['Churn_Binary'].to_numpy()
+            # 0/1 int8 bytes are valid booleans, so the mask can be a zero-copy view
+            self._churn_mask = churn.view(bool) if churn.dtype == np.int8 else churn.astype(bool)
+    
+    def _column_values(self, col):
+        """Float64 NumPy copy of a column with NaN for missing values, staged once per load"""
+        if col not in self._staged:
+            self._staged[col] = self.df[col].to_numpy(dtype='float64', na_value=np.nan)
+        return self._staged[col]
+    
+    def _agg_by(self, key, extras=()):
+        """
+        Aggregate customers, churn and revenue per value of `key` in one bincount pass
+        
+        Args:
+            key (str): Column to group by; missing keys are dropped as in groupby
+            extras (tuple): (output_column, source_column) pairs averaged per group
+            
+        Returns:
+            pd.DataFrame: Total_Customers, Churned_Customers, Churn_Rate (0-1),
+                Total_Revenue and the extras, indexed by the observed groups in sorted order
+        """
+        column = self.df[key]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            codes, groups = column.cat.codes.to_numpy(), column.cat.categories
+        else:
+            codes, groups = pd.factorize(column, sort=True)
+        
+        # Shift codes by one so missing keys (code -1) fall into slot 0, which is discarded
+        slots = codes.astype(np.intp) + 1
+        return self._agg_slots(slots, pd.Index(groups, name=key), extras)
+    
+    def _agg_bins(self, column, edges, labels, name, extras=()):
+        """
+        Aggregate like _agg_by over right-inclusive bins of a numeric column, as pd.cut would
+        
+        Args:
+            column (str): Numeric column to bin
+            edges (list): Bin edges; values outside (edges[0], edges[-1]] are dropped
+            labels (list): One label per bin
+            name (str): Name of the resulting index
+            extras (tuple): (output_column, source_column) pairs averaged per group
+        """
+        slots = np.digitize(self._column_values(column), edges, right=True)
+        # Values at or below the first edge already land in slot 0; send NaNs and
+        # values above the last edge (slot len(edges)) there too
+        slots[slots == len(edges)] = 0
+        return self._agg_slots(slots, pd.Index(labels, name=name), extras)
+    
+    def _agg_slots(self, slots, groups, extras=()):
+        """Bincount aggregation shared by _agg_by and _agg_bins; slot i + 1 holds groups[i]"""
+        length = len(groups) + 1
+        
+        total = np.bincount(slots, minlength=length)[1:]
+        churned = np.bincount(slots, weights=self._column_values('Churn_Binary'), minlength=length)[1:]
+        revenue, _ = _grouped_sum_count(slots, self._column_values('Total_Revenue'), length)
+        
+        observed = total > 0
+        data = {
+            'Total_Customers': total[observed],
+            'Churned_Customers': churned[observed].astype(np.int64),
+            'Churn_Rate': churned[observed] / total[observed],
+            'Total_Revenue': revenue[1:][observed]
+        }
+        for name, source in extras:
+            sums, counts = _grouped_sum_count(slots, self._column_values(source), length)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                data[name] = (sums / counts)[1:][observed]
+        
+        return pd.DataFrame(data, index=groups[observed])
     
     def calculate_primary_kpis(self):
         """Calculate primary KPIs for executive dashboard"""
@@ -80,11 +378,11 @@ class MTNChurnAnalysis:
         try:
             # Overall Churn Rate
             total_customers = len(self.df)
-            churned_customers = self.df['Churn_Binary'].sum()
+            churned_customers = self._churn_mask.sum()
             churn_rate = (churned_customers / total_customers) * 100
             
             # Revenue at Risk
-            revenue_at_risk = self.df[self.df['Churn_Binary'] == 1]['Total_Revenue'].sum()
+            revenue_at_risk = np.nansum(self._column_values('Total_Revenue')[self._churn_mask])
             total_revenue = self.df['Total_Revenue'].sum()
             revenue_risk_percentage = (revenue_at_risk / total_revenue) * 100
             
@@ -113,14 +411,8 @@ class MTNChurnAnalysis:
     def satisfaction_churn_analysis(self):
         """Analyze satisfaction vs churn correlation"""
         try:
-            satisfaction_analysis = self.df.groupby(['Satisfaction_Rate', 'Churn_Binary']).size().unstack(fill_value=0)
-            satisfaction_summary = self.df.groupby('Satisfaction_Rate').agg({
-                'Churn_Binary': ['count', 'sum', 'mean'],
-                'Total_Revenue': 'sum'
-            }).round(2)
-            
-            # Flatten column names
-            satisfaction_summary.columns = ['Total_Customers', 'Churned_Customers', 'Churn_Rate', 'Total_Revenue']
+            satisfaction_analysis = self.df.groupby(['Satisfaction_Rate', 'Churn_Binary'], observed=True).size().unstack(fill_value=0)
+            satisfaction_summary = self._agg_by('Satisfaction_Rate')
             satisfaction_summary['Churn_Rate'] = satisfaction_summary['Churn_Rate'] * 100
             
             self.analysis_results['satisfaction_analysis'] = {
@@ -138,15 +430,7 @@ class MTNChurnAnalysis:
     def geographic_analysis(self):
         """Analyze churn by geographic regions (states)"""
         try:
-            geo_analysis = self.df.groupby('State').agg({
-                'Customer_ID': 'count',
-                'Churn_Binary': ['sum', 'mean'],
-                'Total_Revenue': 'sum',
-                'Satisfaction_Rate': 'mean'
-            }).round(2)
-            
-            # Flatten column names
-            geo_analysis.columns = ['Total_Customers', 'Churned_Customers', 'Churn_Rate', 'Total_Revenue', 'Avg_Satisfaction']
+            geo_analysis = self._agg_by('State', extras=[('Avg_Satisfaction', 'Satisfaction_Rate')])
             geo_analysis['Churn_Rate'] = geo_analysis['Churn_Rate'] * 100
             geo_analysis = geo_analysis.sort_values('Churn_Rate', ascending=False)
             
@@ -170,16 +454,10 @@ class MTNChurnAnalysis:
     def device_performance_analysis(self):
         """Analyze churn by device type"""
         try:
-            device_analysis = self.df.groupby('MTN_Device').agg({
-                'Customer_ID': 'count',
-                'Churn_Binary': ['sum', 'mean'],
-                'Total_Revenue': 'sum',
-                'Unit_Price': 'mean',
-                'Satisfaction_Rate': 'mean'
-            }).round(2)
-            
-            # Flatten column names
-            device_analysis.columns = ['Total_Customers', 'Churned_Customers', 'Churn_Rate', 'Total_Revenue', 'Avg_Unit_Price', 'Avg_Satisfaction']
+            device_analysis = self._agg_by('MTN_Device', extras=[
+                ('Avg_Unit_Price', 'Unit_Price'),
+                ('Avg_Satisfaction', 'Satisfaction_Rate')
+            ])
             device_analysis['Churn_Rate'] = device_analysis['Churn_Rate'] * 100
             device_analysis = device_analysis.sort_values('Churn_Rate', ascending=False)
             
@@ -196,45 +474,23 @@ class MTNChurnAnalysis:
         """Analyze customer segments by age, tenure, and subscription plan"""
         try:
             # Age group analysis
-            self.df['Age_Group'] = pd.cut(self.df['Age'], 
-                                        bins=[0, 25, 35, 45, 55, 100], 
-                                        labels=['18-25', '26-35', '36-45', '46-55', '55+'])
-            
-            age_analysis = self.df.groupby('Age_Group').agg({
-                'Customer_ID': 'count',
-                'Churn_Binary': ['sum', 'mean'],
-                'Total_Revenue': 'sum',
-                'Satisfaction_Rate': 'mean'
-            }).round(2)
-            
-            age_analysis.columns = ['Total_Customers', 'Churned_Customers', 'Churn_Rate', 'Total_Revenue', 'Avg_Satisfaction']
+            age_analysis = self._agg_bins('Age', [0, 25, 35, 45, 55, 100],
+                                          ['18-25', '26-35', '36-45', '46-55', '55+'], 'Age_Group',
+                                          extras=[('Avg_Satisfaction', 'Satisfaction_Rate')])
             age_analysis['Churn_Rate'] = age_analysis['Churn_Rate'] * 100
             
             # Tenure analysis
-            self.df['Tenure_Group'] = pd.cut(self.df['Customer_Tenure_in_months'], 
-                                           bins=[0, 6, 12, 24, 36, 100], 
-                                           labels=['0-6 months', '7-12 months', '13-24 months', '25-36 months', '36+ months'])
-            
-            tenure_analysis = self.df.groupby('Tenure_Group').agg({
-                'Customer_ID': 'count',
-                'Churn_Binary': ['sum', 'mean'],
-                'Total_Revenue': 'sum',
-                'Satisfaction_Rate': 'mean'
-            }).round(2)
-            
-            tenure_analysis.columns = ['Total_Customers', 'Churned_Customers', 'Churn_Rate', 'Total_Revenue', 'Avg_Satisfaction']
+            tenure_analysis = self._agg_bins('Customer_Tenure_in_months', [0, 6, 12, 24, 36, 100],
+                                             ['0-6 months', '7-12 months', '13-24 months', '25-36 months', '36+ months'],
+                                             'Tenure_Group',
+                                             extras=[('Avg_Satisfaction', 'Satisfaction_Rate')])
             tenure_analysis['Churn_Rate'] = tenure_analysis['Churn_Rate'] * 100
             
             # Subscription plan analysis
-            plan_analysis = self.df.groupby('Subscription_Plan').agg({
-                'Customer_ID': 'count',
-                'Churn_Binary': ['sum', 'mean'],
-                'Total_Revenue': 'sum',
-                'Unit_Price': 'mean',
-                'Satisfaction_Rate': 'mean'
-            }).round(2)
-            
-            plan_analysis.columns = ['Total_Customers', 'Churned_Customers', 'Churn_Rate', 'Total_Revenue', 'Avg_Unit_Price', 'Avg_Satisfaction']
+            plan_analysis = self._agg_by('Subscription_Plan', extras=[
+                ('Avg_Unit_Price', 'Unit_Price'),
+                ('Avg_Satisfaction', 'Satisfaction_Rate')
+            ])
             plan_analysis['Churn_Rate'] = plan_analysis['Churn_Rate'] * 100
             
             self.analysis_results['segmentation_analysis'] = {
@@ -257,19 +513,25 @@ class MTNChurnAnalysis:
     def churn_reasons_analysis(self):
         """Analyze reasons for churn"""
         try:
-            churned_customers = self.df[self.df['Churn_Binary'] == 1]
-            
-            if 'Reasons_for_Churn' in churned_customers.columns:
-                reason_counts = churned_customers['Reasons_for_Churn'].value_counts()
-                reason_percentages = (reason_counts / len(churned_customers) * 100).round(2)
+            if 'Reasons_for_Churn' in self.df.columns:
+                reasons = self.df['Reasons_for_Churn'].cat
+                codes = reasons.codes.to_numpy()
+                counts = np.bincount(codes[self._churn_mask & (codes >= 0)],
+                                     minlength=len(reasons.categories))
+                
+                # Most common first, dropping reasons no churned customer gave
+                order = np.argsort(-counts, kind='stable')
+                order = order[counts[order] > 0]
                 
                 churn_reasons_df = pd.DataFrame({
-                    'Reason': reason_counts.index,
-                    'Count': reason_counts.values,
-                    'Percentage': reason_percentages.values
+                    'Reason': reasons.categories[order],
+                    'Count': counts[order],
+                    'Percentage': (counts[order] * (100.0 / self._churn_mask.sum())).round(2)
                 })
                 
                 self.analysis_results['churn_reasons'] = churn_reasons_df
+                # Already sorted, so the dashboard chart can read its slice without re-ranking
+                self.analysis_results['churn_reasons_top10'] = churn_reasons_df.head(10).reset_index(drop=True)
                 
                 print("✅ Churn reasons analysis completed")
                 return churn_reasons_df
@@ -284,28 +546,27 @@ class MTNChurnAnalysis:
     def predictive_analytics(self):
         """Calculate predictive metrics and at-risk customers"""
         try:
-            # At-risk customers (satisfaction <= 2)
-            at_risk_customers = self.df[self.df['Satisfaction_Rate'] <= 2]
-            at_risk_count = len(at_risk_customers)
-            at_risk_revenue = at_risk_customers['Total_Revenue'].sum()
-            
-            # New customers (tenure < 6 months)
-            new_customers = self.df[self.df['Customer_Tenure_in_months'] < 6]
-            new_customer_churn_rate = (new_customers['Churn_Binary'].mean() * 100) if len(new_customers) > 0 else 0
-            
-            # High-value customers at risk
-            revenue_threshold = self.df['Total_Revenue'].quantile(0.75)
-            high_value_at_risk = self.df[
-                (self.df['Total_Revenue'] >= revenue_threshold) & 
-                (self.df['Satisfaction_Rate'] <= 2)
-            ]
+            # High-value threshold: top quartile of revenue
+            revenue_threshold = _quantile_select(self._column_values('Total_Revenue'), 0.75)
+            
+            # At-risk (satisfaction <= 2), new (tenure < 6 months) and high-value at-risk
+            # customers are all tallied in a single scan
+            (at_risk_count, at_risk_revenue, new_count, new_churned,
+             hv_count, hv_revenue) = _predict_kernel(
+                self._column_values('Satisfaction_Rate'),
+                self._column_values('Customer_Tenure_in_months'),
+                self._column_values('Total_Revenue'),
+                self._column_values('Churn_Binary'),
+                revenue_threshold
+            )
+            new_customer_churn_rate = (new_churned / new_count * 100) if new_count > 0 else 0
             
             predictive_results = {
-                'at_risk_count': at_risk_count,
-                'at_risk_revenue': at_risk_revenue,
+                'at_risk_count': int(at_risk_count),
+                'at_risk_revenue': float(at_risk_revenue),
                 'new_customer_churn_rate': round(new_customer_churn_rate, 2),
-                'high_value_at_risk_count': len(high_value_at_risk),
-                'high_value_at_risk_revenue': high_value_at_risk['Total_Revenue'].sum()
+                'high_value_at_risk_count': int(hv_count),
+                'high_value_at_risk_revenue': float(hv_revenue)
             }
             
             self.analysis_results['predictive_analytics'] = predictive_results
@@ -337,6 +598,15 @@ class MTNChurnAnalysis:
         print("✅ Complete analysis finished!")
         return True
     
+    def _write_csv(self, df, filename):
+        """Write a result frame, index included, with pyarrow's multithreaded CSV writer"""
+        try:
+            table = pa.Table.from_pandas(df.round(2).reset_index(), preserve_index=False)
+            pacsv.write_csv(table, filename)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Fall back to pandas for dtypes Arrow cannot represent
+            df.round(2).to_csv(filename)
+    
     def export_to_csv(self, analysis_name=None):
         """Export analysis results to CSV files"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -353,23 +623,25 @@ class MTNChurnAnalysis:
                     for key, value in data.items():
                         if isinstance(value, pd.DataFrame):
                             sub_filename = f"{self.export_folder}/{analysis_name}_{key}_{timestamp}.csv"
-                            value.to_csv(sub_filename)
+                            self._write_csv(value, sub_filename)
                             export_files.append(sub_filename)
                 else:
-                    data.to_csv(filename)
+                    self._write_csv(data, filename)
                     export_files.append(filename)
             else:
                 # Export all analysis results
                 for name, data in self.analysis_results.items():
+                    if name in self._EXPORT_SKIP:
+                        continue
                     if isinstance(data, dict):
                         for key, value in data.items():
                             if isinstance(value, pd.DataFrame):
                                 filename = f"{self.export_folder}/{name}_{key}_{timestamp}.csv"
-                                value.to_csv(filename)
+                                self._write_csv(value, filename)
                                 export_files.append(filename)
                     elif isinstance(data, pd.DataFrame):
                         filename = f"{self.export_folder}/{name}_{timestamp}.csv"
-                        data.to_csv(filename)
+                        self._write_csv(data, filename)
                         export_files.append(filename)
             
             print(f"✅ Exported {len(export_files)} files to {self.export_folder}/")
@@ -379,6 +651,15 @@ class MTNChurnAnalysis:
             print(f"❌ Error exporting to CSV: {str(e)}")
             return []
     
+    def _fast_write_sheet(self, worksheet, df):
+        """Write a frame row by row, skipping the pandas Excel styling layer"""
+        df = df.round(2)
+        worksheet.write_row(0, 0, list(df.columns))
+        # Missing values become None, which xlsxwriter leaves as empty cells
+        body = df.astype(object).where(df.notna(), None)
+        for i, row in enumerate(body.itertuples(index=False, name=None), 1):
+            worksheet.write_row(i, 0, row)
+    
     def export_to_excel(self, filename=None):
         """Export all analysis results to a single Excel file with multiple sheets"""
         if not filename:
@@ -386,25 +667,26 @@ class MTNChurnAnalysis:
             filename = f"{self.export_folder}/MTN_Churn_Analysis_{timestamp}.xlsx"
         
         try:
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            # constant_memory flushes each row to disk as soon as the next one starts
+            with xlsxwriter.Workbook(filename, {'constant_memory': True}) as workbook:
                 # Export primary KPIs
                 if 'primary_kpis' in self.analysis_results:
                     kpis_df = pd.DataFrame([self.analysis_results['primary_kpis']])
-                    kpis_df.to_excel(writer, sheet_name='Primary_KPIs', index=False)
+                    self._fast_write_sheet(workbook.add_worksheet('Primary_KPIs'), kpis_df)
                 
                 # Export other analysis results
                 for name, data in self.analysis_results.items():
-                    if name == 'primary_kpis':
+                    if name == 'primary_kpis' or name in self._EXPORT_SKIP:
                         continue
                         
                     if isinstance(data, dict):
                         for key, value in data.items():
                             if isinstance(value, pd.DataFrame):
                                 sheet_name = f"{name}_{key}"[:31]  # Excel sheet name limit
-                                value.to_excel(writer, sheet_name=sheet_name)
+                                self._fast_write_sheet(workbook.add_worksheet(sheet_name), value.reset_index())
                     elif isinstance(data, pd.DataFrame):
                         sheet_name = name[:31]
-                        data.to_excel(writer, sheet_name=sheet_name)
+                        self._fast_write_sheet(workbook.add_worksheet(sheet_name), data.reset_index())
             
             print(f"✅ Excel file exported: {filename}")
             return filename
@@ -440,7 +722,7 @@ class MTNChurnAnalysis:
                 high_risk = geo_data['high_risk_states']
                 if len(high_risk) > 0:
                     top_risk_state = high_risk.index[0]
-                    top_risk_rate = high_risk.iloc[0]['Churn_Rate']
+                    top_risk_rate = round(high_risk.iloc[0]['Churn_Rate'], 2)
                     summary.append(f"• Highest Risk State: {top_risk_state} ({top_risk_rate}%)")
         
         # Device performance
@@ -448,7 +730,7 @@ class MTNChurnAnalysis:
             device_data = self.analysis_results['device_analysis']
             if len(device_data) > 0:
                 worst_device = device_data.index[0]
-                worst_rate = device_data.iloc[0]['Churn_Rate']
+                worst_rate = round(device_data.iloc[0]['Churn_Rate'], 2)
                 summary.append(f"\n📱 DEVICE INSIGHTS:")
                 summary.append(f"• Highest Risk Device: {worst_device} ({worst_rate}%)")
         
@@ -1,18 +1,29 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from datetime import datetime, timedelta
+import pyarrow as pa
+import csv
+import gzip
+import hashlib
 import os
-import base64
-from io import BytesIO
+from datetime import datetime, timedelta
+from io import BytesIO, StringIO
 import zipfile
 
+try:
+    import xxhash
+except ImportError:
+    # xxhash is optional; hashlib covers the small payloads hashed here
+    xxhash = None
+
 # Import the analysis model
 from mtn_churn_model import MTNChurnAnalysis
 
+# Timestamp for export file names; the script re-executes on every rerun, so this is taken once per run
+RUN_TS = datetime.now().strftime('%Y%m%d_%H%M%S')
+
 # Page configuration
 st.set_page_config(
     page_title="MTN Customer Churn Analysis Dashboard",
@@ -35,26 +46,6 @@ st.markdown("""
         -webkit-text-fill-color: transparent;
     }
     
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    
-    .metric-value {
-        font-size: 2rem;
-        font-weight: bold;
-        margin: 0.5rem 0;
-    }
-    
-    .metric-label {
-        font-size: 0.9rem;
-        opacity: 0.8;
-    }
-    
     .success-message {
         background-color: #d4edda;
         border: 1px solid #c3e6cb;
@@ -91,22 +82,42 @@ if 'data_loaded' not in st.session_state:
 if 'analysis_complete' not in st.session_state:
     st.session_state.analysis_complete = False
 
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _shared_analyzer(file_hash: str, _file_bytes: bytes):
+    """Load an upload once per file content; every session uploading the same file shares the analyzer"""
+    analyzer = MTNChurnAnalysis()
+    return analyzer if analyzer.load_data(BytesIO(_file_bytes)) else None
+
+def _hash_frame(df):
+    """Hash every row of a DataFrame; Streamlit's default hash samples large frames"""
+    return pd.util.hash_pandas_object(df, index=True).values.tobytes()
+
+@st.cache_data(show_spinner=False, max_entries=4, hash_funcs={pd.DataFrame: _hash_frame})
+def _compute_results(df: pd.DataFrame) -> dict:
+    """Run the complete analysis on a loaded frame; cached on the frame's contents"""
+    analyzer = MTNChurnAnalysis()
+    if not analyzer.load_dataframe(df) or not analyzer.run_complete_analysis():
+        return None
+    return analyzer.analysis_results
+
+def _digest(payload: bytes) -> str:
+    """Short content hash: xxhash when installed, blake2b otherwise"""
+    if xxhash is not None:
+        return xxhash.xxh64(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
 def load_data():
     """Load data from uploaded file"""
     if st.session_state.uploaded_file is not None:
         try:
-            # Save uploaded file temporarily
-            with open("temp_data.csv", "wb") as f:
-                f.write(st.session_state.uploaded_file.getbuffer())
-            
-            # Load data using the analyzer
-            if st.session_state.analyzer.load_data("temp_data.csv"):
+            # Parse in memory, reusing the analyzer of any session that loaded the same bytes
+            file_bytes = st.session_state.uploaded_file.getvalue()
+            analyzer = _shared_analyzer(hashlib.md5(file_bytes).hexdigest(), file_bytes)
+            if analyzer is not None:
+                st.session_state.analyzer = analyzer
                 st.session_state.data_loaded = True
                 st.session_state.analysis_complete = False
                 
-                # Clean up temp file
-                os.remove("temp_data.csv")
-                
                 st.success(f"✅ Data loaded successfully! {len(st.session_state.analyzer.df)} records found.")
                 return True
             else:
@@ -122,7 +133,11 @@ def run_analysis():
     """Run complete analysis"""
     if st.session_state.data_loaded:
         with st.spinner("🔄 Running comprehensive analysis..."):
-            if st.session_state.analyzer.run_complete_analysis():
+            analyzer = st.session_state.analyzer
+            # A shared analyzer may already hold results from another session
+            results = analyzer.analysis_results or _compute_results(analyzer.df)
+            if results is not None:
+                analyzer.analysis_results = results
                 st.session_state.analysis_complete = True
                 st.success("✅ Analysis completed successfully!")
                 return True
@@ -133,715 +148,982 @@ def run_analysis():
         st.warning("⚠️ Please load data first.")
         return False
 
-def create_download_link(data, filename, file_format="csv"):
-    """Create download link for data"""
-    if file_format == "csv":
-        csv = data.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
-        href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">📥 Download {filename}</a>'
-    else:
-        # For Excel files
-        output = BytesIO()
-        data.to_excel(output, index=False)
-        excel_data = output.getvalue()
-        b64 = base64.b64encode(excel_data).decode()
-        href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}">📥 Download {filename}</a>'
+def iter_csv(df, index=True, chunk=10_000):
+    """Yield a frame's CSV text in row batches so the whole string never sits in memory at once"""
+    buf = StringIO()
+    df.iloc[:0].to_csv(buf, index=index)
+    yield buf.getvalue()
+    for start in range(0, len(df), chunk):
+        buf.seek(0)
+        buf.truncate()
+        df.iloc[start:start + chunk].to_csv(buf, index=index, header=False)
+        yield buf.getvalue()
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def _csv_bytes(df: pd.DataFrame, index: bool = True) -> bytes:
+    """Serialize a frame for st.download_button, rounded to 2dp; cached so repeat renders skip to_csv"""
+    df = df.round(2)
+    if len(df) > 1_000_000:
+        return b"".join(part.encode('utf-8') for part in iter_csv(df, index=index))
+    return df.to_csv(index=index).encode('utf-8')
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def _csv_gz_bytes(df: pd.DataFrame, index: bool = True) -> bytes:
+    """Gzip a frame's CSV with a fast compression level; text-heavy CSVs shrink several times over"""
+    return gzip.compress(_csv_bytes(df, index=index), compresslevel=1)
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def _parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame to Parquet for st.download_button, rounded to 2dp; far smaller than CSV"""
+    buffer = BytesIO()
+    df.round(2).to_parquet(buffer, engine='pyarrow', compression='snappy', index=False)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False)
+def _dict_csv_bytes(record: dict) -> bytes:
+    """Serialize a single-row dict of metrics as a header line and a value line"""
+    buf = StringIO()
+    writer = csv.writer(buf, lineterminator='\n')
+    writer.writerow(record.keys())
+    writer.writerow(record.values())
+    return buf.getvalue().encode('utf-8')
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_export_zip(_analyzer, results_key):
+    """Write the Excel and CSV exports once per analysed dataset and pack them into a zip
     
-    return href
+    Args:
+        _analyzer: Analyzer holding the results (not hashed)
+        results_key: Hash of the analysed data, used as the cache key
+        
+    Returns:
+        tuple: (zip bytes, Excel file path or None, number of CSV files)
+    """
+    excel_file = _analyzer.export_to_excel()
+    csv_files = _analyzer.export_to_csv()
+    
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for path in ([excel_file] if excel_file else []) + csv_files:
+            archive.write(path, arcname=os.path.basename(path))
+    return buffer.getvalue(), excel_file, len(csv_files)
 
 def format_number(num):
     """Format numbers with commas"""
-    if pd.isna(num) or num is None:
-        return "N/A"
-    try:
-        # Handle both integer and float values
-        if isinstance(num, (int, float)):
-            return f"{num:,.0f}"
-        else:
-            # Try to convert to float first
-            return f"{float(num):,.0f}"
-    except (ValueError, TypeError):
-        return str(num)
+    return "N/A" if num is None or num != num else f"{num:,.0f}"
 
 def format_currency(num):
     """Format currency with Naira symbol"""
-    if pd.isna(num) or num is None:
-        return "N/A"
-    try:
-        if isinstance(num, (int, float)):
-            return f"₦{num:,.2f}"
-        else:
-            # Try to convert to float first
-            return f"₦{float(num):,.2f}"
-    except (ValueError, TypeError):
-        return str(num)
+    return "N/A" if num is None or num != num else f"₦{num:,.2f}"
 
 def format_percentage(num):
     """Format percentage"""
-    if pd.isna(num) or num is None:
-        return "N/A"
-    try:
-        if isinstance(num, (int, float)):
-            return f"{num:.1f}%"
-        else:
-            return f"{float(num):.1f}%"
-    except (ValueError, TypeError):
-        return str(num)
+    return "N/A" if num is None or num != num else f"{num:.1f}%"
 
-# Sidebar
-st.sidebar.title("📱 MTN Churn Analysis")
-st.sidebar.markdown("---")
+@st.cache_data(show_spinner=False)
+def fmt_money_bulk(items: tuple) -> dict:
+    """Format every (name, amount) pair as Naira in one cached call"""
+    return {name: format_currency(amount) for name, amount in items}
 
-# File upload
-st.sidebar.subheader("📁 Data Upload")
-uploaded_file = st.sidebar.file_uploader(
-    "Choose your CSV file",
-    type=['csv'],
-    help="Upload your customer data CSV file",
-    key="uploaded_file",
-    on_change=load_data
-)
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def _reasons_display(reasons_df: pd.DataFrame) -> pd.DataFrame:
+    """Churn reasons with Count and Percentage pre-formatted as strings, so st.dataframe needs no Styler"""
+    return reasons_df.assign(
+        Count=reasons_df['Count'].map('{:,.0f}'.format),
+        Percentage=reasons_df['Percentage'].map('{:.1f}%'.format)
+    )
 
-# Analysis controls
-st.sidebar.markdown("---")
-st.sidebar.subheader("🔄 Analysis Controls")
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _hash_frame})
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    """Convert a display frame to Arrow once so st.dataframe can ship it without re-converting"""
+    return pa.Table.from_pandas(df, preserve_index=False)
 
-if st.sidebar.button("🚀 Run Complete Analysis", disabled=not st.session_state.data_loaded):
-    run_analysis()
+def display_dataframe_quickly(df, formats, key, max_rows=500):
+    """Render a styled table, styling only a window of at most max_rows rows
+    
+    Args:
+        df: Frame to display
+        formats: Column -> format string mapping passed to Styler.format
+        key: Unique widget key for the row slider
+        max_rows: Largest number of rows styled and sent per render
+    """
+    start = 0
+    if len(df) > max_rows:
+        start = st.slider("First row shown", min_value=0, max_value=len(df) - max_rows,
+                          value=0, step=1, key=key)
+    st.dataframe(df.iloc[start:start + max_rows].style.format(formats))
 
-if st.sidebar.button("📥 Export All Results", disabled=not st.session_state.analysis_complete):
-    with st.spinner("Exporting results..."):
-        excel_file = st.session_state.analyzer.export_to_excel()
-        csv_files = st.session_state.analyzer.export_to_csv()
-        
-        if excel_file:
-            st.sidebar.success(f"✅ Results exported to: {excel_file}")
-        if csv_files:
-            st.sidebar.success(f"✅ {len(csv_files)} CSV files exported")
+def _bin_scatter_points(df, x, y, size, label, resolution=800, min_points=500):
+    """Merge scatter points that fall in the same cell of a resolution x resolution grid
+    
+    Args:
+        df: Frame with one row per point
+        x, y: Axis columns
+        size: Marker size column, summed within a cell
+        label: Hover label column; merged cells show the first label and a count
+        resolution: Grid cells per axis, roughly the chart width in pixels
+        min_points: Frames smaller than this are returned unchanged
+    """
+    if len(df) < min_points:
+        return df
+    
+    cells = np.zeros(len(df), dtype=np.int64)
+    for col in (x, y):
+        values = df[col].to_numpy(dtype=float)
+        edges = np.linspace(np.nanmin(values), np.nanmax(values), resolution + 1)
+        cells = cells * (resolution + 2) + np.digitize(values, edges[1:-1])
+    
+    grouped = df.groupby(cells, sort=False)
+    binned = grouped.agg({x: 'mean', y: 'mean', size: 'sum', label: 'first'})
+    extra = grouped.size() - 1
+    names = binned[label].astype(str)
+    binned[label] = names.where(extra == 0, names + ' +' + extra.astype(str) + ' more')
+    return binned.reset_index(drop=True)
 
-# Main content
-st.markdown('<h1 class="main-header">MTN Customer Churn Analysis Dashboard</h1>', unsafe_allow_html=True)
+def collapse_tail(df, key='Reason', metric='Percentage', keep=15):
+    """Keep the keep largest rows by metric and fold the rest into a single "Other" row"""
+    top = df.nlargest(keep, metric)
+    tail = df.drop(top.index)
+    if len(tail):
+        other = pd.DataFrame([{key: 'Other', 'Count': tail['Count'].sum(), metric: tail[metric].sum()}])
+        return pd.concat([top, other], ignore_index=True)
+    return top
 
-# Create tabs
-if st.session_state.data_loaded:
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
-        "🏠 Home", "📊 Primary KPIs", "😊 Satisfaction Analysis", 
-        "🗺️ Geographic Analysis", "📱 Device Analysis", 
-        "👥 Customer Segmentation", "🔮 Predictive Analytics"
-    ])
+_RISK_COLORS = {'low': '#d4edda', 'med': '#fff3cd', 'high': '#f8d7da'}
+
+def _churn_risk_band(churn_rate):
+    """Split churn rates into low/med/high tertiles for a discrete bar palette"""
+    # Tertiles of the distinct rates, like qcut(..., 3) but safe with fewer than three rows.
+    # Dense ranks keep tied rates in one band; centring each rank means a lone rate is 'med'.
+    ranks = churn_rate.rank(method='dense').to_numpy().astype(int) - 1
+    distinct = churn_rate.nunique() or 1
+    bands = np.array(list(_RISK_COLORS))[(2 * ranks + 1) * 3 // (2 * distinct)]
+    return pd.Categorical(bands, categories=list(_RISK_COLORS))
+
+# Chart builders, cached so reruns reuse figures whose inputs have not changed
+_cache_figure = st.cache_data(show_spinner=False, max_entries=32, hash_funcs={pd.DataFrame: _hash_frame})
+
+@_cache_figure
+def _fig_gauge(churn_rate: float) -> go.Figure:
+    """Churn rate gauge against the 15% reference"""
+    fig_gauge = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        value = churn_rate,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Churn Rate (%)"},
+        delta = {'reference': 15, 'increasing': {'color': "red"}, 'decreasing': {'color': "green"}},
+        gauge = {
+            'axis': {'range': [None, 50]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 10], 'color': "lightgreen"},
+                {'range': [10, 20], 'color': "yellow"},
+                {'range': [20, 50], 'color': "lightcoral"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 25
+            }
+        }
+    ))
+    fig_gauge.update_layout(height=400)
+    return fig_gauge
+
+@_cache_figure
+def _fig_satisfaction(summary_rst: pd.DataFrame) -> go.Figure:
+    """Churn rate by satisfaction score"""
+    import plotly.express as px
     
-    with tab1:
-        st.markdown("## 📊 Executive Summary")
-        
-        if st.session_state.analysis_complete:
-            # Display summary report
-            summary_report = st.session_state.analyzer.get_summary_report()
-            st.markdown(f"```\n{summary_report}\n```")
-            
-            # Key metrics in cards
-            if 'primary_kpis' in st.session_state.analyzer.analysis_results:
-                kpis = st.session_state.analyzer.analysis_results['primary_kpis']
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="metric-label">Total Customers</div>
-                        <div class="metric-value">{format_number(kpis.get('total_customers', 0))}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    churn_rate = kpis.get('churn_rate', 0)
-                    color = "#e74c3c" if churn_rate > 20 else "#f39c12" if churn_rate > 10 else "#27ae60"
-                    st.markdown(f"""
-                    <div class="metric-card" style="background: {color};">
-                        <div class="metric-label">Churn Rate</div>
-                        <div class="metric-value">{format_percentage(churn_rate)}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col3:
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <div class="metric-label">Revenue at Risk</div>
-                        <div class="metric-value">{format_currency(kpis.get('revenue_at_risk', 0))}</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col4:
-                    satisfaction = kpis.get('avg_satisfaction', 0)
-                    color = "#e74c3c" if satisfaction < 2.5 else "#f39c12" if satisfaction < 3.5 else "#27ae60"
-                    st.markdown(f"""
-                    <div class="metric-card" style="background: {color};">
-                        <div class="metric-label">Avg Satisfaction</div>
-                        <div class="metric-value">{satisfaction:.1f}/5.0</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                # Additional insights
-                st.markdown("### 🎯 Key Insights")
-                
-                insight_col1, insight_col2 = st.columns(2)
-                
-                with insight_col1:
-                    st.markdown("""
-                    <div class="info-box">
-                        <h4>📈 Business Impact</h4>
-                        <p>Monitor churn trends and revenue protection strategies</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with insight_col2:
-                    st.markdown("""
-                    <div class="info-box">
-                        <h4>🎯 Action Items</h4>
-                        <p>Focus on satisfaction improvement and geographic hotspots</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-        else:
-            st.info("🔄 Please run the analysis to see the executive summary.")
-            if st.button("🚀 Run Analysis Now"):
-                run_analysis()
+    fig_satisfaction = px.bar(
+        summary_rst,
+        x='Satisfaction_Rate',
+        y='Churn_Rate',
+        title='Churn Rate by Satisfaction Score',
+        labels={'Churn_Rate': 'Churn Rate (%)', 'Satisfaction_Rate': 'Satisfaction Score'},
+        color='Churn_Rate',
+        color_continuous_scale='Reds'
+    )
+    fig_satisfaction.update_layout(height=500)
+    return fig_satisfaction
+
+@_cache_figure
+def _fig_satisfaction_distribution(summary_rst: pd.DataFrame) -> go.Figure:
+    """Customer share by satisfaction score"""
+    import plotly.express as px
     
-    with tab2:
-        st.markdown("## 📊 Primary KPIs Dashboard")
+    fig_dist = px.pie(
+        summary_rst,
+        values='Total_Customers',
+        names='Satisfaction_Rate',
+        title='Customer Distribution by Satisfaction Score'
+    )
+    return fig_dist
+
+@_cache_figure
+def _fig_states(top_10_states: pd.DataFrame) -> go.Figure:
+    """Churn rate of the highest-risk states"""
+    import plotly.express as px
+    
+    fig_states = px.bar(
+        top_10_states.assign(Churn_Risk=_churn_risk_band(top_10_states['Churn_Rate'])),
+        x='State',
+        y='Churn_Rate',
+        title='Top 10 States by Churn Rate',
+        labels={'Churn_Rate': 'Churn Rate (%)', 'State': 'State'},
+        color='Churn_Risk',
+        color_discrete_map=_RISK_COLORS,
+        category_orders={'Churn_Risk': list(_RISK_COLORS), 'State': list(top_10_states['State'])}
+    )
+    fig_states.update_layout(height=500, xaxis_tickangle=-45)
+    return fig_states
+
+@_cache_figure
+def _fig_state_revenue(state_rst: pd.DataFrame) -> go.Figure:
+    """Revenue vs churn rate by state"""
+    import plotly.express as px
+    
+    fig_revenue = px.scatter(
+        _bin_scatter_points(state_rst, 'Total_Revenue', 'Churn_Rate', 'Total_Customers', 'State'),
+        x='Total_Revenue',
+        y='Churn_Rate',
+        size='Total_Customers',
+        hover_name='State',
+        title='Revenue vs Churn Rate by State',
+        labels={'Total_Revenue': 'Total Revenue (₦)', 'Churn_Rate': 'Churn Rate (%)'}
+    )
+    return fig_revenue
+
+@_cache_figure
+def _fig_device(device_rst: pd.DataFrame) -> go.Figure:
+    """Churn rate by device type"""
+    import plotly.express as px
+    
+    fig_device = px.bar(
+        device_rst,
+        x='MTN_Device',
+        y='Churn_Rate',
+        title='Churn Rate by Device Type',
+        labels={'Churn_Rate': 'Churn Rate (%)', 'MTN_Device': 'Device Type'},
+        color='Churn_Rate',
+        color_continuous_scale='RdYlBu_r'
+    )
+    fig_device.update_layout(height=500, xaxis_tickangle=-45)
+    return fig_device
+
+@_cache_figure
+def _fig_device_distribution(device_rst: pd.DataFrame) -> go.Figure:
+    """Customer share by device type"""
+    import plotly.express as px
+    
+    fig_donut = px.pie(
+        device_rst,
+        values='Total_Customers',
+        names='MTN_Device',
+        title='Customer Distribution by Device Type',
+        hole=0.4
+    )
+    return fig_donut
+
+@_cache_figure
+def _fig_device_revenue(device_rst: pd.DataFrame) -> go.Figure:
+    """Revenue vs satisfaction by device type"""
+    import plotly.express as px
+    
+    fig_scatter = px.scatter(
+        _bin_scatter_points(device_rst, 'Avg_Satisfaction', 'Total_Revenue', 'Total_Customers', 'MTN_Device'),
+        x='Avg_Satisfaction',
+        y='Total_Revenue',
+        size='Total_Customers',
+        hover_name='MTN_Device',
+        title='Revenue vs Satisfaction by Device Type',
+        labels={'Avg_Satisfaction': 'Average Satisfaction', 'Total_Revenue': 'Total Revenue (₦)'}
+    )
+    return fig_scatter
+
+@_cache_figure
+def _fig_age(age_rst: pd.DataFrame) -> go.Figure:
+    """Churn rate by age group"""
+    import plotly.express as px
+    
+    fig_age = px.bar(
+        age_rst.assign(Churn_Risk=_churn_risk_band(age_rst['Churn_Rate'])),
+        x='Age_Group',
+        y='Churn_Rate',
+        title='Churn Rate by Age Group',
+        labels={'Churn_Rate': 'Churn Rate (%)', 'Age_Group': 'Age Group'},
+        color='Churn_Risk',
+        color_discrete_map=_RISK_COLORS,
+        category_orders={'Churn_Risk': list(_RISK_COLORS), 'Age_Group': list(age_rst['Age_Group'])}
+    )
+    return fig_age
+
+@_cache_figure
+def _fig_tenure(tenure_rst: pd.DataFrame) -> go.Figure:
+    """Churn rate by tenure group"""
+    import plotly.express as px
+    
+    fig_tenure = px.line(
+        tenure_rst,
+        x='Tenure_Group',
+        y='Churn_Rate',
+        title='Churn Rate by Tenure Group',
+        labels={'Churn_Rate': 'Churn Rate (%)', 'Tenure_Group': 'Tenure Group'},
+        markers=True
+    )
+    return fig_tenure
+
+@_cache_figure
+def _fig_plan(plan_rst: pd.DataFrame) -> go.Figure:
+    """Plan price vs churn rate"""
+    import plotly.express as px
+    
+    fig_plan = px.scatter(
+        _bin_scatter_points(plan_rst, 'Avg_Unit_Price', 'Churn_Rate', 'Total_Customers', 'Subscription_Plan'),
+        x='Avg_Unit_Price',
+        y='Churn_Rate',
+        size='Total_Customers',
+        hover_name='Subscription_Plan',
+        title='Plan Price vs Churn Rate',
+        labels={'Avg_Unit_Price': 'Average Unit Price (₦)', 'Churn_Rate': 'Churn Rate (%)'}
+    )
+    return fig_plan
+
+@_cache_figure
+def _fig_reasons(top10: pd.DataFrame) -> go.Figure:
+    """Top 10 churn reasons"""
+    import plotly.express as px
+    
+    fig_reasons = px.bar(
+        top10,
+        x='Percentage',
+        y='Reason',
+        orientation='h',
+        height=500,
+        title='Top 10 Churn Reasons',
+        labels={'Percentage': 'Percentage (%)', 'Reason': 'Churn Reason'}
+    )
+    fig_reasons.update_layout(uirevision='reasons', dragmode=False)
+    return fig_reasons
+
+# Static HTML blocks, built once at import rather than on every rerun
+_WELCOME_HTML = """
+<div style="text-align: center; padding: 2rem;">
+    <h2>Welcome to MTN Customer Churn Analysis Dashboard</h2>
+    <p>Upload your customer data CSV file to get started with comprehensive churn analysis.</p>
+</div>
+"""
+
+_IMMEDIATE_ACTIONS_HTML = """
+<div class="info-box">
+    <h4>🚨 Immediate Actions</h4>
+    <ul>
+        <li>Contact at-risk customers immediately</li>
+        <li>Implement retention campaigns</li>
+        <li>Review pricing strategies</li>
+        <li>Improve network quality in high-churn areas</li>
+    </ul>
+</div>
+"""
+
+_MONITORING_FOCUS_HTML = """
+<div class="info-box">
+    <h4>📊 Monitoring Focus</h4>
+    <ul>
+        <li>Track satisfaction scores weekly</li>
+        <li>Monitor new customer onboarding</li>
+        <li>Analyze competitive responses</li>
+        <li>Review device performance regularly</li>
+    </ul>
+</div>
+"""
+
+# Both action cards side by side in one markdown call instead of two st.columns cells
+_ACTION_CARDS_HTML = (
+    '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">'
+    + _IMMEDIATE_ACTIONS_HTML + _MONITORING_FOCUS_HTML
+    + '</div>'
+)
+
+_FOOTER_HTML = """
+<div style="text-align: center; color: #666; padding: 1rem;">
+    <p><strong>MTN Customer Churn Analysis Dashboard</strong> | Built with Streamlit</p>
+    <p>📊 Comprehensive Analytics • 🔄 Real-time Processing • 📥 Export Ready</p>
+</div>
+"""
+
+# Tab bodies run as fragments so interacting with one tab only reruns that tab
+@st.fragment
+def _tab_home(analyzer):
+    """Executive summary and headline KPI cards"""
+    st.markdown("## 📊 Executive Summary")
+    
+    if st.session_state.analysis_complete:
+        # Display summary report
+        summary_report = analyzer.get_summary_report()
+        st.markdown(f"```\n{summary_report}\n```")
         
-        if st.session_state.analysis_complete and 'primary_kpis' in st.session_state.analyzer.analysis_results:
-            kpis = st.session_state.analyzer.analysis_results['primary_kpis']
+        # Key metrics in cards
+        if 'primary_kpis' in analyzer.analysis_results:
+            kpis = analyzer.analysis_results['primary_kpis']
+            total_customers = kpis.get('total_customers', 0)
+            churn_rate = kpis.get('churn_rate', 0)
+            revenue_at_risk = kpis.get('revenue_at_risk', 0)
+            satisfaction = kpis.get('avg_satisfaction', 0)
             
-            # KPI Metrics
-            col1, col2, col3 = st.columns(3)
+            col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric(
-                    label="Total Customers",
-                    value=format_number(kpis.get('total_customers', 0)),
-                    delta=f"Active: {format_number(kpis.get('active_customers', 0))}"
-                )
+                st.metric(label="Total Customers", value=format_number(total_customers))
             
             with col2:
-                churn_rate = kpis.get('churn_rate', 0)
-                st.metric(
-                    label="Churn Rate",
-                    value=f"{churn_rate:.1f}%",
-                    delta=f"Churned: {format_number(kpis.get('churned_customers', 0))}"
-                )
+                st.metric(label="Churn Rate", value=format_percentage(churn_rate))
             
             with col3:
-                st.metric(
-                    label="Revenue at Risk",
-                    value=format_currency(kpis.get('revenue_at_risk', 0)),
-                    delta=f"{kpis.get('revenue_risk_percentage', 0):.1f}% of total revenue"
-                )
+                st.metric(label="Revenue at Risk", value=format_currency(revenue_at_risk))
             
-            # Churn Rate Gauge Chart
-            st.markdown("### 📊 Churn Rate Gauge")
-            
-            fig_gauge = go.Figure(go.Indicator(
-                mode = "gauge+number+delta",
-                value = churn_rate,
-                domain = {'x': [0, 1], 'y': [0, 1]},
-                title = {'text': "Churn Rate (%)"},
-                delta = {'reference': 15, 'increasing': {'color': "red"}, 'decreasing': {'color': "green"}},
-                gauge = {
-                    'axis': {'range': [None, 50]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 10], 'color': "lightgreen"},
-                        {'range': [10, 20], 'color': "yellow"},
-                        {'range': [20, 50], 'color': "lightcoral"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 25
-                    }
-                }
-            ))
-            fig_gauge.update_layout(height=400)
-            st.plotly_chart(fig_gauge, use_container_width=True)
+            with col4:
+                st.metric(label="Avg Satisfaction", value=f"{satisfaction:.1f}/5.0")
             
-            # Export option
-            st.markdown("### 📥 Export KPIs")
-            kpis_df = pd.DataFrame([kpis])
-            csv = kpis_df.to_csv(index=False)
-            st.download_button(
-                label="Download KPIs as CSV",
-                data=csv,
-                file_name=f"primary_kpis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
-        else:
-            st.info("🔄 Please run the analysis to see Primary KPIs.")
+            # Additional insights
+            st.markdown("### 🎯 Key Insights")
+            
+            insight_col1, insight_col2 = st.columns(2)
+            
+            with insight_col1:
+                st.markdown("""
+                <div class="info-box">
+                    <h4>📈 Business Impact</h4>
+                    <p>Monitor churn trends and revenue protection strategies</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with insight_col2:
+                st.markdown("""
+                <div class="info-box">
+                    <h4>🎯 Action Items</h4>
+                    <p>Focus on satisfaction improvement and geographic hotspots</p>
+                </div>
+                """, unsafe_allow_html=True)
+    else:
+        st.info("🔄 Please run the analysis to see the executive summary.")
+        # The fragment reruns alone on this click, so rerun the app for the other tabs to pick up the results
+        if st.button("🚀 Run Analysis Now") and run_analysis():
+            st.rerun()
+
+@st.fragment
+def _tab_kpis(analyzer):
+    """Primary KPI metrics, gauge and export"""
+    st.markdown("## 📊 Primary KPIs Dashboard")
     
-    with tab3:
-        st.markdown("## 😊 Satisfaction vs Churn Analysis")
+    if st.session_state.analysis_complete and 'primary_kpis' in analyzer.analysis_results:
+        kpis = analyzer.analysis_results['primary_kpis']
+        churn_rate = kpis.get('churn_rate', 0)
         
-        if st.session_state.analysis_complete and 'satisfaction_analysis' in st.session_state.analyzer.analysis_results:
-            satisfaction_data = st.session_state.analyzer.analysis_results['satisfaction_analysis']
-            
-            if 'summary' in satisfaction_data:
-                summary_df = satisfaction_data['summary']
-                
-                # Display summary table
-                st.markdown("### 📋 Satisfaction Summary")
-                st.dataframe(summary_df.style.format({
-                    'Total_Customers': '{:,.0f}',
-                    'Churned_Customers': '{:,.0f}',
-                    'Churn_Rate': '{:.1f}%',
-                    'Total_Revenue': '₦{:,.2f}'
-                }))
-                
-                # Satisfaction vs Churn Rate Chart
-                st.markdown("### 📊 Satisfaction vs Churn Rate")
-                
-                fig_satisfaction = px.bar(
-                    summary_df.reset_index(),
-                    x='Satisfaction_Rate',
-                    y='Churn_Rate',
-                    title='Churn Rate by Satisfaction Score',
-                    labels={'Churn_Rate': 'Churn Rate (%)', 'Satisfaction_Rate': 'Satisfaction Score'},
-                    color='Churn_Rate',
-                    color_continuous_scale='Reds'
-                )
-                fig_satisfaction.update_layout(height=500)
-                st.plotly_chart(fig_satisfaction, use_container_width=True)
-                
-                # Customer Distribution by Satisfaction
-                st.markdown("### 👥 Customer Distribution by Satisfaction")
-                
-                fig_dist = px.pie(
-                    summary_df.reset_index(),
-                    values='Total_Customers',
-                    names='Satisfaction_Rate',
-                    title='Customer Distribution by Satisfaction Score'
-                )
-                st.plotly_chart(fig_dist, use_container_width=True)
-                
-                # Critical insights
-                st.markdown("### 🚨 Critical Insights")
-                
-                low_satisfaction = summary_df[summary_df.index <= 2]
-                if len(low_satisfaction) > 0:
-                    low_sat_customers = low_satisfaction['Total_Customers'].sum()
-                    low_sat_churn_rate = low_satisfaction['Churn_Rate'].mean()
-                    
-                    st.warning(f"⚠️ **Satisfaction Alert**: {low_sat_customers:,.0f} customers have satisfaction scores ≤ 2 with an average churn rate of {low_sat_churn_rate:.1f}%")
-                
-                # Export option
-                st.markdown("### 📥 Export Satisfaction Analysis")
-                csv = summary_df.to_csv()
-                st.download_button(
-                    label="Download Satisfaction Analysis as CSV",
-                    data=csv,
-                    file_name=f"satisfaction_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-        else:
-            st.info("🔄 Please run the analysis to see Satisfaction Analysis.")
+        # KPI Metrics
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric(
+                label="Total Customers",
+                value=format_number(kpis.get('total_customers', 0)),
+                delta=f"Active: {format_number(kpis.get('active_customers', 0))}"
+            )
+        
+        with col2:
+            st.metric(
+                label="Churn Rate",
+                value=f"{churn_rate:.1f}%",
+                delta=f"Churned: {format_number(kpis.get('churned_customers', 0))}"
+            )
+        
+        with col3:
+            st.metric(
+                label="Revenue at Risk",
+                value=format_currency(kpis.get('revenue_at_risk', 0)),
+                delta=f"{kpis.get('revenue_risk_percentage', 0):.1f}% of total revenue"
+            )
+        
+        # Churn Rate Gauge Chart
+        st.markdown("### 📊 Churn Rate Gauge")
+        
+        fig_gauge = _fig_gauge(churn_rate)
+        st.plotly_chart(fig_gauge, use_container_width=True)
+        
+        # Export option
+        st.markdown("### 📥 Export KPIs")
+        csv = _dict_csv_bytes(kpis)
+        st.download_button(
+            label="Download KPIs as CSV",
+            data=csv,
+            file_name=f"primary_kpis_{RUN_TS}.csv",
+            mime="text/csv"
+        )
+    else:
+        st.info("🔄 Please run the analysis to see Primary KPIs.")
+
+@st.fragment
+def _tab_satisfaction(analyzer):
+    """Satisfaction vs churn breakdown"""
+    st.markdown("## 😊 Satisfaction vs Churn Analysis")
     
-    with tab4:
-        st.markdown("## 🗺️ Geographic Analysis")
+    if st.session_state.analysis_complete and 'satisfaction_analysis' in analyzer.analysis_results:
+        satisfaction_data = analyzer.analysis_results['satisfaction_analysis']
         
-        if st.session_state.analysis_complete and 'geographic_analysis' in st.session_state.analyzer.analysis_results:
-            geo_data = st.session_state.analyzer.analysis_results['geographic_analysis']
+        if 'summary' in satisfaction_data:
+            summary_df = satisfaction_data['summary']
+            summary_rst = summary_df.reset_index()
             
-            if 'state_summary' in geo_data:
-                state_df = geo_data['state_summary']
-                
-                # Display state summary
-                st.markdown("### 📋 State-wise Performance")
-                st.dataframe(state_df.style.format({
-                    'Total_Customers': '{:,.0f}',
-                    'Churned_Customers': '{:,.0f}',
-                    'Churn_Rate': '{:.1f}%',
-                    'Total_Revenue': '₦{:,.2f}',
-                    'Avg_Satisfaction': '{:.1f}'
-                }))
-                
-                # Top 10 states by churn rate
-                st.markdown("### 🔥 Top 10 High-Risk States")
-                
-                top_10_states = state_df.head(10)
-                
-                fig_states = px.bar(
-                    top_10_states.reset_index(),
-                    x='State',
-                    y='Churn_Rate',
-                    title='Top 10 States by Churn Rate',
-                    labels={'Churn_Rate': 'Churn Rate (%)', 'State': 'State'},
-                    color='Churn_Rate',
-                    color_continuous_scale='Reds'
-                )
-                fig_states.update_layout(height=500, xaxis_tickangle=-45)
-                st.plotly_chart(fig_states, use_container_width=True)
-                
-                # Revenue impact by state
-                st.markdown("### 💰 Revenue Impact by State")
-                
-                fig_revenue = px.scatter(
-                    state_df.reset_index(),
-                    x='Total_Revenue',
-                    y='Churn_Rate',
-                    size='Total_Customers',
-                    hover_name='State',
-                    title='Revenue vs Churn Rate by State',
-                    labels={'Total_Revenue': 'Total Revenue (₦)', 'Churn_Rate': 'Churn Rate (%)'}
+            # Display summary table
+            st.markdown("### 📋 Satisfaction Summary")
+            display_dataframe_quickly(summary_df, {
+                'Total_Customers': '{:,.0f}',
+                'Churned_Customers': '{:,.0f}',
+                'Churn_Rate': '{:.1f}%',
+                'Total_Revenue': '₦{:,.2f}'
+            }, key='summary_table_rows')
+            
+            # Satisfaction vs Churn Rate Chart
+            st.markdown("### 📊 Satisfaction vs Churn Rate")
+            
+            fig_satisfaction = _fig_satisfaction(summary_rst)
+            st.plotly_chart(fig_satisfaction, use_container_width=True)
+            
+            # Customer Distribution by Satisfaction
+            st.markdown("### 👥 Customer Distribution by Satisfaction")
+            
+            fig_dist = _fig_satisfaction_distribution(summary_rst)
+            st.plotly_chart(fig_dist, use_container_width=True)
+            
+            # Critical insights
+            st.markdown("### 🚨 Critical Insights")
+            
+            low_mask = summary_df.index <= 2
+            if low_mask.any():
+                low_sat_customers, low_sat_churn_rate = summary_df.loc[low_mask, ['Total_Customers', 'Churn_Rate']].agg(
+                    {'Total_Customers': 'sum', 'Churn_Rate': 'mean'}
                 )
-                st.plotly_chart(fig_revenue, use_container_width=True)
                 
-                # High-risk states alert
-                if 'high_risk_states' in geo_data:
-                    high_risk = geo_data['high_risk_states']
-                    if len(high_risk) > 0:
-                        st.markdown("### 🚨 High-Risk States Alert")
-                        st.error(f"⚠️ **{len(high_risk)} states** have churn rates above the national average of {geo_data.get('avg_churn_rate', 0):.1f}%")
-                        
-                        # Show top 3 high-risk states
-                        top_3_risk = high_risk.head(3)
-                        for idx, (state, data) in enumerate(top_3_risk.iterrows()):
-                            st.warning(f"#{idx+1}. **{state}**: {data['Churn_Rate']:.1f}% churn rate ({data['Total_Customers']:,.0f} customers)")
-                
-                # Export option
-                st.markdown("### 📥 Export Geographic Analysis")
-                csv = state_df.to_csv()
-                st.download_button(
-                    label="Download Geographic Analysis as CSV",
-                    data=csv,
-                    file_name=f"geographic_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-        else:
-            st.info("🔄 Please run the analysis to see Geographic Analysis.")
+                st.warning(f"⚠️ **Satisfaction Alert**: {low_sat_customers:,.0f} customers have satisfaction scores ≤ 2 with an average churn rate of {low_sat_churn_rate:.1f}%")
+            
+            # Export option
+            st.markdown("### 📥 Export Satisfaction Analysis")
+            csv = _csv_bytes(summary_df)
+            st.download_button(
+                label="Download Satisfaction Analysis as CSV",
+                data=csv,
+                file_name=f"satisfaction_analysis_{RUN_TS}.csv",
+                mime="text/csv"
+            )
+    else:
+        st.info("🔄 Please run the analysis to see Satisfaction Analysis.")
+
+@st.fragment
+def _tab_geographic(analyzer):
+    """State-level churn and revenue"""
+    st.markdown("## 🗺️ Geographic Analysis")
     
-    with tab5:
-        st.markdown("## 📱 Device Performance Analysis")
+    if st.session_state.analysis_complete and 'geographic_analysis' in analyzer.analysis_results:
+        geo_data = analyzer.analysis_results['geographic_analysis']
         
-        if st.session_state.analysis_complete and 'device_analysis' in st.session_state.analyzer.analysis_results:
-            device_df = st.session_state.analyzer.analysis_results['device_analysis']
+        if 'state_summary' in geo_data:
+            state_df = geo_data['state_summary']
+            state_rst = state_df.reset_index()
             
-            # Display device summary
-            st.markdown("### 📋 Device Performance Summary")
-            st.dataframe(device_df.style.format({
+            # Display state summary
+            st.markdown("### 📋 State-wise Performance")
+            display_dataframe_quickly(state_df, {
                 'Total_Customers': '{:,.0f}',
                 'Churned_Customers': '{:,.0f}',
                 'Churn_Rate': '{:.1f}%',
                 'Total_Revenue': '₦{:,.2f}',
-                'Avg_Unit_Price': '₦{:,.2f}',
                 'Avg_Satisfaction': '{:.1f}'
-            }))
-            
-            # Device churn rate comparison
-            st.markdown("### 📊 Churn Rate by Device Type")
-            
-            fig_device = px.bar(
-                device_df.reset_index(),
-                x='MTN_Device',
-                y='Churn_Rate',
-                title='Churn Rate by Device Type',
-                labels={'Churn_Rate': 'Churn Rate (%)', 'MTN_Device': 'Device Type'},
-                color='Churn_Rate',
-                color_continuous_scale='RdYlBu_r'
-            )
-            fig_device.update_layout(height=500, xaxis_tickangle=-45)
-            st.plotly_chart(fig_device, use_container_width=True)
-            
-            # Device performance donut chart
-            st.markdown("### 🍩 Customer Distribution by Device")
-            
-            fig_donut = px.pie(
-                device_df.reset_index(),
-                values='Total_Customers',
-                names='MTN_Device',
-                title='Customer Distribution by Device Type',
-                hole=0.4
-            )
-            st.plotly_chart(fig_donut, use_container_width=True)
-            
-            # Revenue vs Satisfaction scatter
-            st.markdown("### 💰 Revenue vs Satisfaction by Device")
-            
-            fig_scatter = px.scatter(
-                device_df.reset_index(),
-                x='Avg_Satisfaction',
-                y='Total_Revenue',
-                size='Total_Customers',
-                hover_name='MTN_Device',
-                title='Revenue vs Satisfaction by Device Type',
-                labels={'Avg_Satisfaction': 'Average Satisfaction', 'Total_Revenue': 'Total Revenue (₦)'}
-            )
-            st.plotly_chart(fig_scatter, use_container_width=True)
+            }, key='state_table_rows')
             
-            # Device insights
-            st.markdown("### 🎯 Device Insights")
+            # Top 10 states by churn rate
+            st.markdown("### 🔥 Top 10 High-Risk States")
             
-            if len(device_df) > 0:
-                worst_device = device_df.index[0]
-                worst_rate = device_df.iloc[0]['Churn_Rate']
-                best_device = device_df.index[-1]
-                best_rate = device_df.iloc[-1]['Churn_Rate']
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.error(f"🚨 **Highest Risk**: {worst_device} with {worst_rate:.1f}% churn rate")
-                
-                with col2:
-                    st.success(f"✅ **Best Performer**: {best_device} with {best_rate:.1f}% churn rate")
+            top_10_states = state_rst.head(10)
+            
+            fig_states = _fig_states(top_10_states)
+            st.plotly_chart(fig_states, use_container_width=True)
+            
+            # Revenue impact by state
+            st.markdown("### 💰 Revenue Impact by State")
+            
+            fig_revenue = _fig_state_revenue(state_rst)
+            st.plotly_chart(fig_revenue, use_container_width=True)
+            
+            # High-risk states alert
+            if 'high_risk_states' in geo_data:
+                high_risk = geo_data['high_risk_states']
+                if len(high_risk) > 0:
+                    st.markdown("### 🚨 High-Risk States Alert")
+                    st.error(f"⚠️ **{len(high_risk)} states** have churn rates above the national average of {geo_data.get('avg_churn_rate', 0):.1f}%")
+                    
+                    # Show top 3 high-risk states
+                    top_3_risk = high_risk.head(3)
+                    for idx, (state, data) in enumerate(top_3_risk.iterrows()):
+                        st.warning(f"#{idx+1}. **{state}**: {data['Churn_Rate']:.1f}% churn rate ({data['Total_Customers']:,.0f} customers)")
             
             # Export option
-            st.markdown("### 📥 Export Device Analysis")
-            csv = device_df.to_csv()
+            st.markdown("### 📥 Export Geographic Analysis")
+            csv = _csv_bytes(state_df)
             st.download_button(
-                label="Download Device Analysis as CSV",
+                label="Download Geographic Analysis as CSV",
                 data=csv,
-                file_name=f"device_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"geographic_analysis_{RUN_TS}.csv",
                 mime="text/csv"
             )
-        else:
-            st.info("🔄 Please run the analysis to see Device Analysis.")
+    else:
+        st.info("🔄 Please run the analysis to see Geographic Analysis.")
+
+@st.fragment
+def _tab_device(analyzer):
+    """Device performance breakdown"""
+    st.markdown("## 📱 Device Performance Analysis")
     
-    with tab6:
-        st.markdown("## 👥 Customer Segmentation Analysis")
+    if st.session_state.analysis_complete and 'device_analysis' in analyzer.analysis_results:
+        device_df = analyzer.analysis_results['device_analysis']
+        device_rst = device_df.reset_index()
         
-        if st.session_state.analysis_complete and 'segmentation_analysis' in st.session_state.analyzer.analysis_results:
-            seg_data = st.session_state.analyzer.analysis_results['segmentation_analysis']
-            
-            # Age Group Analysis
-            if 'age_analysis' in seg_data:
-                st.markdown("### 👶 Age Group Analysis")
-                age_df = seg_data['age_analysis']
-                
-                st.dataframe(age_df.style.format({
-                    'Total_Customers': '{:,.0f}',
-                    'Churned_Customers': '{:,.0f}',
-                    'Churn_Rate': '{:.1f}%',
-                    'Total_Revenue': '₦{:,.2f}',
-                    'Avg_Satisfaction': '{:.1f}'
-                }))
-                
-                # Age group churn visualization
-                fig_age = px.bar(
-                    age_df.reset_index(),
-                    x='Age_Group',
-                    y='Churn_Rate',
-                    title='Churn Rate by Age Group',
-                    labels={'Churn_Rate': 'Churn Rate (%)', 'Age_Group': 'Age Group'},
-                    color='Churn_Rate',
-                    color_continuous_scale='Reds'
-                )
-                st.plotly_chart(fig_age, use_container_width=True)
-                
-                # Export age analysis
-                csv_age = age_df.to_csv()
-                st.download_button(
-                    label="Download Age Analysis as CSV",
-                    data=csv_age,
-                    file_name=f"age_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            
-            # Tenure Analysis
-            if 'tenure_analysis' in seg_data:
-                st.markdown("### ⏰ Customer Tenure Analysis")
-                tenure_df = seg_data['tenure_analysis']
-                
-                st.dataframe(tenure_df.style.format({
-                    'Total_Customers': '{:,.0f}',
-                    'Churned_Customers': '{:,.0f}',
-                    'Churn_Rate': '{:.1f}%',
-                    'Total_Revenue': '₦{:,.2f}',
-                    'Avg_Satisfaction': '{:.1f}'
-                }))
-                
-                # Tenure churn visualization
-                fig_tenure = px.line(
-                    tenure_df.reset_index(),
-                    x='Tenure_Group',
-                    y='Churn_Rate',
-                    title='Churn Rate by Tenure Group',
-                    labels={'Churn_Rate': 'Churn Rate (%)', 'Tenure_Group': 'Tenure Group'},
-                    markers=True
-                )
-                st.plotly_chart(fig_tenure, use_container_width=True)
-                
-                # Export tenure analysis
-                csv_tenure = tenure_df.to_csv()
-                st.download_button(
-                    label="Download Tenure Analysis as CSV",
-                    data=csv_tenure,
-                    file_name=f"tenure_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-            
-            # Subscription Plan Analysis
-            if 'plan_analysis' in seg_data:
-                st.markdown("### 📋 Subscription Plan Analysis")
-                plan_df = seg_data['plan_analysis']
-                
-                st.dataframe(plan_df.style.format({
-                    'Total_Customers': '{:,.0f}',
-                    'Churned_Customers': '{:,.0f}',
-                    'Churn_Rate': '{:.1f}%',
-                    'Total_Revenue': '₦{:,.2f}',
-                    'Avg_Unit_Price': '₦{:,.2f}',
-                    'Avg_Satisfaction': '{:.1f}'
-                }))
-                
-                # Plan performance visualization
-                fig_plan = px.scatter(
-                    plan_df.reset_index(),
-                    x='Avg_Unit_Price',
-                    y='Churn_Rate',
-                    size='Total_Customers',
-                    hover_name='Subscription_Plan',
-                    title='Plan Price vs Churn Rate',
-                    labels={'Avg_Unit_Price': 'Average Unit Price (₦)', 'Churn_Rate': 'Churn Rate (%)'}
-                )
-                st.plotly_chart(fig_plan, use_container_width=True)
-                
-                # Export plan analysis
-                csv_plan = plan_df.to_csv()
-                st.download_button(
-                    label="Download Plan Analysis as CSV",
-                    data=csv_plan,
-                    file_name=f"plan_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
-        else:
-            st.info("🔄 Please run the analysis to see Customer Segmentation.")
-    
-    with tab7:
-        st.markdown("## 🔮 Predictive Analytics")
+        # Display device summary
+        st.markdown("### 📋 Device Performance Summary")
+        display_dataframe_quickly(device_df, {
+            'Total_Customers': '{:,.0f}',
+            'Churned_Customers': '{:,.0f}',
+            'Churn_Rate': '{:.1f}%',
+            'Total_Revenue': '₦{:,.2f}',
+            'Avg_Unit_Price': '₦{:,.2f}',
+            'Avg_Satisfaction': '{:.1f}'
+        }, key='device_table_rows')
         
-        if st.session_state.analysis_complete and 'predictive_analytics' in st.session_state.analyzer.analysis_results:
-            pred_data = st.session_state.analyzer.analysis_results['predictive_analytics']
-            
-            # Predictive metrics
-            st.markdown("### 📊 Predictive Metrics")
+        # Device churn rate comparison
+        st.markdown("### 📊 Churn Rate by Device Type")
+        
+        fig_device = _fig_device(device_rst)
+        st.plotly_chart(fig_device, use_container_width=True)
+        
+        # Device performance donut chart
+        st.markdown("### 🍩 Customer Distribution by Device")
+        
+        fig_donut = _fig_device_distribution(device_rst)
+        st.plotly_chart(fig_donut, use_container_width=True)
+        
+        # Revenue vs Satisfaction scatter
+        st.markdown("### 💰 Revenue vs Satisfaction by Device")
+        
+        fig_scatter = _fig_device_revenue(device_rst)
+        st.plotly_chart(fig_scatter, use_container_width=True)
+        
+        # Device insights
+        st.markdown("### 🎯 Device Insights")
+        
+        if len(device_df) > 0:
+            worst_device = device_df.index[0]
+            worst_rate = device_df.iloc[0]['Churn_Rate']
+            best_device = device_df.index[-1]
+            best_rate = device_df.iloc[-1]['Churn_Rate']
             
-            col1, col2, col3 = st.columns(3)
+            col1, col2 = st.columns(2)
             
             with col1:
-                st.metric(
-                    label="At-Risk Customers",
-                    value=format_number(pred_data.get('at_risk_count', 0)),
-                    help="Customers with satisfaction ≤ 2"
-                )
+                st.error(f"🚨 **Highest Risk**: {worst_device} with {worst_rate:.1f}% churn rate")
             
             with col2:
-                st.metric(
-                    label="At-Risk Revenue",
-                    value=format_currency(pred_data.get('at_risk_revenue', 0)),
-                    help="Revenue from at-risk customers"
-                )
-            
-            with col3:
-                st.metric(
-                    label="New Customer Churn Rate",
-                    value=format_percentage(pred_data.get('new_customer_churn_rate', 0)),
-                    help="Churn rate for customers with < 6 months tenure"
-                )
+                st.success(f"✅ **Best Performer**: {best_device} with {best_rate:.1f}% churn rate")
+        
+        # Export option
+        st.markdown("### 📥 Export Device Analysis")
+        csv = _csv_bytes(device_df)
+        st.download_button(
+            label="Download Device Analysis as CSV",
+            data=csv,
+            file_name=f"device_analysis_{RUN_TS}.csv",
+            mime="text/csv"
+        )
+    else:
+        st.info("🔄 Please run the analysis to see Device Analysis.")
+
+@st.fragment
+def _tab_segmentation(analyzer):
+    """Age, tenure and plan segmentation"""
+    st.markdown("## 👥 Customer Segmentation Analysis")
+    
+    if st.session_state.analysis_complete and 'segmentation_analysis' in analyzer.analysis_results:
+        seg_data = analyzer.analysis_results['segmentation_analysis']
+        
+        # Age Group Analysis
+        if 'age_analysis' in seg_data:
+            st.markdown("### 👶 Age Group Analysis")
+            age_df = seg_data['age_analysis']
             
-            # High-value customers at risk
-            st.markdown("### 💎 High-Value Customers at Risk")
+            display_dataframe_quickly(age_df, {
+                'Total_Customers': '{:,.0f}',
+                'Churned_Customers': '{:,.0f}',
+                'Churn_Rate': '{:.1f}%',
+                'Total_Revenue': '₦{:,.2f}',
+                'Avg_Satisfaction': '{:.1f}'
+            }, key='age_table_rows')
             
-            hv_count = pred_data.get('high_value_at_risk_count', 0)
-            hv_revenue = pred_data.get('high_value_at_risk_revenue', 0)
+            # Age group churn visualization
+            fig_age = _fig_age(age_df.reset_index())
+            st.plotly_chart(fig_age, use_container_width=True)
             
-            if hv_count > 0:
-                st.error(f"🚨 **Critical Alert**: {hv_count:,} high-value customers are at risk, representing {format_currency(hv_revenue)} in potential revenue loss!")
-            else:
-                st.success("✅ No high-value customers currently at risk")
+            # Export age analysis
+            csv_age = _csv_bytes(age_df)
+            st.download_button(
+                label="Download Age Analysis as CSV",
+                data=csv_age,
+                file_name=f"age_analysis_{RUN_TS}.csv",
+                mime="text/csv"
+            )
+        
+        # Tenure Analysis
+        if 'tenure_analysis' in seg_data:
+            st.markdown("### ⏰ Customer Tenure Analysis")
+            tenure_df = seg_data['tenure_analysis']
             
-            # Churn reasons analysis
-            if 'churn_reasons' in st.session_state.analyzer.analysis_results:
-                st.markdown("### 📋 Top Churn Reasons")
-                
-                reasons_df = st.session_state.analyzer.analysis_results['churn_reasons']
-                
-                if len(reasons_df) > 0:
-                    # Display top reasons
-                    st.dataframe(reasons_df.style.format({
-                        'Count': '{:,.0f}',
-                        'Percentage': '{:.1f}%'
-                    }))
-                    
-                    # Visualize top reasons
-                    fig_reasons = px.bar(
-                        reasons_df.head(10),
-                        x='Percentage',
-                        y='Reason',
-                        orientation='h',
-                        title='Top 10 Churn Reasons',
-                        labels={'Percentage': 'Percentage (%)', 'Reason': 'Churn Reason'}
-                    )
-                    fig_reasons.update_layout(height=500)
-                    st.plotly_chart(fig_reasons, use_container_width=True)
-                    
-                    # Export churn reasons
-                    csv_reasons = reasons_df.to_csv(index=False)
-                    st.download_button(
-                        label="Download Churn Reasons as CSV",
-                        data=csv_reasons,
-                        file_name=f"churn_reasons_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
+            display_dataframe_quickly(tenure_df, {
+                'Total_Customers': '{:,.0f}',
+                'Churned_Customers': '{:,.0f}',
+                'Churn_Rate': '{:.1f}%',
+                'Total_Revenue': '₦{:,.2f}',
+                'Avg_Satisfaction': '{:.1f}'
+            }, key='tenure_table_rows')
             
-            # Action recommendations
-            st.markdown("### 🎯 Recommended Actions")
+            # Tenure churn visualization
+            fig_tenure = _fig_tenure(tenure_df.reset_index())
+            st.plotly_chart(fig_tenure, use_container_width=True)
             
-            action_col1, action_col2 = st.columns(2)
+            # Export tenure analysis
+            csv_tenure = _csv_bytes(tenure_df)
+            st.download_button(
+                label="Download Tenure Analysis as CSV",
+                data=csv_tenure,
+                file_name=f"tenure_analysis_{RUN_TS}.csv",
+                mime="text/csv"
+            )
+        
+        # Subscription Plan Analysis
+        if 'plan_analysis' in seg_data:
+            st.markdown("### 📋 Subscription Plan Analysis")
+            plan_df = seg_data['plan_analysis']
             
-            with action_col1:
-                st.markdown("""
-                <div class="info-box">
-                    <h4>🚨 Immediate Actions</h4>
-                    <ul>
-                        <li>Contact at-risk customers immediately</li>
-                        <li>Implement retention campaigns</li>
-                        <li>Review pricing strategies</li>
-                        <li>Improve network quality in high-churn areas</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+            display_dataframe_quickly(plan_df, {
+                'Total_Customers': '{:,.0f}',
+                'Churned_Customers': '{:,.0f}',
+                'Churn_Rate': '{:.1f}%',
+                'Total_Revenue': '₦{:,.2f}',
+                'Avg_Unit_Price': '₦{:,.2f}',
+                'Avg_Satisfaction': '{:.1f}'
+            }, key='plan_table_rows')
             
-            with action_col2:
-                st.markdown("""
-                <div class="info-box">
-                    <h4>📊 Monitoring Focus</h4>
-                    <ul>
-                        <li>Track satisfaction scores weekly</li>
-                        <li>Monitor new customer onboarding</li>
-                        <li>Analyze competitive responses</li>
-                        <li>Review device performance regularly</li>
-                    </ul>
-                </div>
-                """, unsafe_allow_html=True)
+            # Plan performance visualization
+            fig_plan = _fig_plan(plan_df.reset_index())
+            st.plotly_chart(fig_plan, use_container_width=True)
             
-            # Export predictive analytics
-            st.markdown("### 📥 Export Predictive Analytics")
-            pred_df = pd.DataFrame([pred_data])
-            csv_pred = pred_df.to_csv(index=False)
+            # Export plan analysis
+            csv_plan = _csv_bytes(plan_df)
             st.download_button(
-                label="Download Predictive Analytics as CSV",
-                data=csv_pred,
-                file_name=f"predictive_analytics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                label="Download Plan Analysis as CSV",
+                data=csv_plan,
+                file_name=f"plan_analysis_{RUN_TS}.csv",
                 mime="text/csv"
             )
+    else:
+        st.info("🔄 Please run the analysis to see Customer Segmentation.")
+
+@st.fragment
+def _tab_predictive(analyzer):
+    """Churn reasons, risk segments and action plan"""
+    st.markdown("## 🔮 Predictive Analytics")
+    
+    pred_data = analyzer.analysis_results.get('predictive_analytics')
+    if not st.session_state.analysis_complete or pred_data is None:
+        st.info("🔄 Please run the analysis to see Predictive Analytics.")
+        return
+    
+    # Display strings only change when the analysis is re-run, so keep them per results hash
+    pred_hash = _digest(repr(sorted(pred_data.items())).encode())
+    if st.session_state.get('_pred_hash') != pred_hash:
+        money = fmt_money_bulk(tuple(sorted((k, v) for k, v in pred_data.items() if 'revenue' in k)))
+        st.session_state._pred_display = {
+            'at_risk_count': format_number(pred_data.get('at_risk_count', 0)),
+            'at_risk_revenue': money['at_risk_revenue'],
+            'new_customer_churn_rate': format_percentage(pred_data.get('new_customer_churn_rate', 0)),
+            'high_value_at_risk_revenue': money['high_value_at_risk_revenue']
+        }
+        st.session_state._pred_hash = pred_hash
+    shown = st.session_state._pred_display
+    
+    # Predictive metrics
+    st.markdown("### 📊 Predictive Metrics")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="At-Risk Customers",
+            value=shown['at_risk_count'],
+            help="Customers with satisfaction ≤ 2"
+        )
+    
+    with col2:
+        st.metric(
+            label="At-Risk Revenue",
+            value=shown['at_risk_revenue'],
+            help="Revenue from at-risk customers"
+        )
+    
+    with col3:
+        st.metric(
+            label="New Customer Churn Rate",
+            value=shown['new_customer_churn_rate'],
+            help="Churn rate for customers with < 6 months tenure"
+        )
+    
+    # High-value customers at risk
+    st.markdown("### 💎 High-Value Customers at Risk")
+    
+    hv_count = pred_data.get('high_value_at_risk_count', 0)
+    
+    if hv_count > 0:
+        st.error(f"🚨 **Critical Alert**: {hv_count:,} high-value customers are at risk, representing {shown['high_value_at_risk_revenue']} in potential revenue loss!")
+    else:
+        st.success("✅ No high-value customers currently at risk")
+    
+    # Churn reasons analysis
+    reasons_df = analyzer.analysis_results.get('churn_reasons')
+    if reasons_df is not None and not reasons_df.empty:
+        st.markdown("### 📋 Top Churn Reasons")
+        
+        top10 = analyzer.analysis_results.get('churn_reasons_top10')
+        if top10 is None:
+            top10 = reasons_df.head(10)
+        
+        # Display top reasons
+        st.dataframe(_to_arrow(_reasons_display(collapse_tail(reasons_df))), use_container_width=True, hide_index=True)
+        
+        # Visualize top reasons
+        fig_reasons = _fig_reasons(top10)
+        st.plotly_chart(fig_reasons, use_container_width=True, theme=None, config={
+            'displaylogo': False,
+            'modeBarButtonsToRemove': ['zoom', 'pan', 'select', 'lasso2d', 'autoScale2d']
+        })
+        
+        # Export churn reasons, gzipped once the CSV is big enough for compression to pay off
+        csv_reasons = _csv_bytes(reasons_df, index=False)
+        if len(csv_reasons) > 1_000_000:
+            st.download_button(
+                label="Download Churn Reasons as CSV (gzip)",
+                data=_csv_gz_bytes(reasons_df, index=False),
+                file_name=f"churn_reasons_{RUN_TS}.csv.gz",
+                mime="application/gzip"
+            )
         else:
-            st.info("🔄 Please run the analysis to see Predictive Analytics.")
+            st.download_button(
+                label="Download Churn Reasons as CSV",
+                data=csv_reasons,
+                file_name=f"churn_reasons_{RUN_TS}.csv",
+                mime="text/csv"
+            )
+        st.download_button(
+            label="Download Churn Reasons as Parquet",
+            data=_parquet_bytes(reasons_df),
+            file_name=f"churn_reasons_{RUN_TS}.parquet",
+            mime="application/octet-stream"
+        )
+    
+    # Action recommendations
+    st.markdown("### 🎯 Recommended Actions")
+    
+    st.markdown(_ACTION_CARDS_HTML, unsafe_allow_html=True)
+    
+    # Export predictive analytics
+    st.markdown("### 📥 Export Predictive Analytics")
+    csv_pred = _dict_csv_bytes(pred_data)
+    st.download_button(
+        label="Download Predictive Analytics as CSV",
+        data=csv_pred,
+        file_name=f"predictive_analytics_{RUN_TS}.csv",
+        mime="text/csv"
+    )
+
+# Sidebar
+st.sidebar.title("📱 MTN Churn Analysis")
+st.sidebar.markdown("---")
+
+# File upload
+st.sidebar.subheader("📁 Data Upload")
+uploaded_file = st.sidebar.file_uploader(
+    "Choose your CSV file",
+    type=['csv'],
+    help="Upload your customer data CSV file",
+    key="uploaded_file",
+    on_change=load_data
+)
+
+# Analysis controls
+st.sidebar.markdown("---")
+st.sidebar.subheader("🔄 Analysis Controls")
+
+if st.sidebar.button("🚀 Run Complete Analysis", disabled=not st.session_state.data_loaded):
+    run_analysis()
+
+if st.sidebar.button("📥 Export All Results", disabled=not st.session_state.analysis_complete):
+    with st.spinner("Exporting results..."):
+        zip_bytes, excel_file, csv_count = _build_export_zip(
+            st.session_state.analyzer, _hash_frame(st.session_state.analyzer.df)
+        )
+        
+        if excel_file:
+            st.sidebar.success(f"✅ Results exported to: {excel_file}")
+        if csv_count:
+            st.sidebar.success(f"✅ {csv_count} CSV files exported")
+        
+        st.sidebar.download_button(
+            label="Download ZIP",
+            data=zip_bytes,
+            file_name=f"mtn_churn_results_{RUN_TS}.zip",
+            mime="application/zip"
+        )
+
+# Main content
+st.markdown('<h1 class="main-header">MTN Customer Churn Analysis Dashboard</h1>', unsafe_allow_html=True)
 
+# Create tabs
+if st.session_state.data_loaded:
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+        "🏠 Home", "📊 Primary KPIs", "😊 Satisfaction Analysis", 
+        "🗺️ Geographic Analysis", "📱 Device Analysis", 
+        "👥 Customer Segmentation", "🔮 Predictive Analytics"
+    ])
+    
+    with tab1:
+        _tab_home(st.session_state.analyzer)
+    
+    with tab2:
+        _tab_kpis(st.session_state.analyzer)
+    
+    with tab3:
+        _tab_satisfaction(st.session_state.analyzer)
+    
+    with tab4:
+        _tab_geographic(st.session_state.analyzer)
+    
+    with tab5:
+        _tab_device(st.session_state.analyzer)
+    
+    with tab6:
+        _tab_segmentation(st.session_state.analyzer)
+    
+    with tab7:
+        _tab_predictive(st.session_state.analyzer)
+    
 else:
     # Welcome screen
-    st.markdown("""
-    <div style="text-align: center; padding: 2rem;">
-        <h2>Welcome to MTN Customer Churn Analysis Dashboard</h2>
-        <p>Upload your customer data CSV file to get started with comprehensive churn analysis.</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
     
     # Required columns info box
     st.info("""
@@ -921,9 +1203,4 @@ else:
 
 # Footer
 st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #666; padding: 1rem;">
-    <p><strong>MTN Customer Churn Analysis Dashboard</strong> | Built with Streamlit</p>
-    <p>📊 Comprehensive Analytics • 🔄 Real-time Processing • 📥 Export Ready</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
\ No newline at end of file
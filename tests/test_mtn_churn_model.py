@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from io import BytesIO
+from pathlib import Path
+
+from mtn_churn_model import MTNChurnAnalysis
+
+
+CSV = b"""Customer_ID,Age,State,Satisfaction_Rate,Customer_Tenure_in_months,Number_of_Times_Purchased,Unit_Price,Total_Revenue,Data_Usage,Customer_Churn_Status
+C1,30,Lagos,300,70000,40000,1500.5,60020000,12.5,Yes
+C2,41,Kano,4,12,3,2000,6000,3.25,No
+"""
+
+
+class OutOfRangeValuesTest(unittest.TestCase):
+    """Values too large for the narrow Int dtypes must survive loading unchanged"""
+
+    def setUp(self):
+        self._cwd = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._cwd.name)
+
+    def tearDown(self):
+        self._cwd.cleanup()
+
+    def assertValuesKept(self, df):
+        self.assertEqual(df['Satisfaction_Rate'].tolist(), [300, 4])
+        self.assertEqual(df['Customer_Tenure_in_months'].tolist(), [70000, 12])
+        self.assertEqual(df['Number_of_Times_Purchased'].tolist(), [40000, 3])
+        self.assertEqual(df['Churn_Binary'].tolist(), [1, 0])
+
+    def test_buffer_upload(self):
+        analyzer = MTNChurnAnalysis()
+        self.assertTrue(analyzer.load_data(BytesIO(CSV)))
+        self.assertValuesKept(analyzer.df)
+
+    def test_csv_path_and_parquet_cache(self):
+        csv_path = self.tmp / 'customers.csv'
+        csv_path.write_bytes(CSV)
+
+        first = MTNChurnAnalysis(str(csv_path))
+        self.assertTrue(first.load_data())
+        self.assertValuesKept(first.df)
+        self.assertTrue((self.tmp / 'customers.mtn_prepared.parquet').exists())
+
+        cached = MTNChurnAnalysis(str(csv_path))
+        self.assertTrue(cached.load_data())
+        self.assertValuesKept(cached.df)
+
+
+if __name__ == '__main__':
+    unittest.main()